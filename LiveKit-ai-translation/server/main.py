@@ -1,10 +1,12 @@
 import asyncio
 import logging
-import json
+import orjson
 import time
 import re
 import websockets
-from typing import Set, Any
+import aiohttp
+from typing import Set, Any, Optional
+from collections import deque
 
 from enum import Enum
 from dataclasses import dataclass, asdict
@@ -26,59 +28,207 @@ from livekit.plugins.speechmatics.types import TranscriptionConfig
 from dotenv import load_dotenv
 import os
 
+# Use uvloop's faster event loop when available (not supported on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 load_dotenv()
 
 logger = logging.getLogger("transcriber")
 
-# WebSocket server for display clients
-connected_displays: Set[Any] = set()
+# How display clients are served:
+#   "external"   - POST to websocket-server.py on http://localhost:8766, which serves ws://localhost:8765 (any number of rooms)
+#   "in_process" - the job serves ws://localhost:8765 itself (one room at a time, the port can only be bound once)
+DISPLAY_MODE_EXTERNAL = "external"
+DISPLAY_MODE_IN_PROCESS = "in_process"
+DISPLAY_SERVER_MODE = os.getenv("DISPLAY_SERVER_MODE", DISPLAY_MODE_EXTERNAL)
+
+_BROADCAST_TIMEOUT = aiohttp.ClientTimeout(total=1)
+_BROADCAST_QUEUE_SIZE = 1024
+_BROADCAST_BATCH_SIZE = 32  # Max messages coalesced into one relay pass
+_DISPLAY_SEND_CHUNK = 50  # Display clients sent to before yielding to the event loop
+_DISPLAY_SEND_TIMEOUT = 5.0  # Seconds before a slow display client is dropped
+
+
+class DisplayBroadcaster:
+    """Relays one job's transcriptions/translations to the WebSocket display clients.
+
+    The queue, relay task, HTTP session and display server all belong to the job that
+    created the broadcaster and are released by aclose() when that job shuts down.
+    """
+
+    def __init__(self, mode: str = DISPLAY_SERVER_MODE):
+        if mode not in (DISPLAY_MODE_EXTERNAL, DISPLAY_MODE_IN_PROCESS):
+            logger.warning("Unknown DISPLAY_SERVER_MODE %r, using %r", mode, DISPLAY_MODE_EXTERNAL)
+            mode = DISPLAY_MODE_EXTERNAL
+        self.mode = mode
+        self.connected_displays: Set[Any] = set()
+        # Pre-serialized outgoing display messages (one list of payloads per entry), drained by _relay()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=_BROADCAST_QUEUE_SIZE)
+        self._relay_task: Optional[asyncio.Task] = None
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        # Display WebSocket server, only used in in-process mode
+        self._server: Optional[Any] = None
+
+    async def start(self):
+        """Start the relay task, and in in-process mode the display server"""
+        if self.mode == DISPLAY_MODE_IN_PROCESS:
+            try:
+                self._server = await self._start_websocket_server()
+            except OSError as e:
+                logger.warning(
+                    "📡 Could not bind display port 8765 (%s). In-process display mode serves one room at a time; "
+                    "captions for this room will not reach displays (set DISPLAY_SERVER_MODE=external for multiple rooms)",
+                    e,
+                )
+                return
+        else:
+            logger.info("📡 Relaying display captions to external display server on http://localhost:8766")
+        self._relay_task = asyncio.create_task(self._relay())
+
+    async def aclose(self):
+        """Stop the relay task and release the display server and HTTP session"""
+        if self._relay_task is not None:
+            self._relay_task.cancel()
+            try:
+                await self._relay_task
+            except asyncio.CancelledError:
+                pass
+            self._relay_task = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+
+    def broadcast(self, message_type: str, language: str, text: str):
+        """Queue transcription/translation for the WebSocket display clients (non-blocking)"""
+        self._enqueue([self._payload(message_type, language, text)])
+
+    def broadcast_translations(self, translations: list[tuple[str, str]]):
+        """Queue one sentence's (language, text) translations for the display clients in a single entry"""
+        self._enqueue([self._payload("translation", language, text) for language, text in translations])
+
+    @staticmethod
+    def _payload(message_type: str, language: str, text: str) -> bytes:
+        """Serialize one transcription/translation message for the display clients"""
+        message = {
+            "type": message_type,
+            "language": language,
+            "text": text,
+            "timestamp": time.time(),
+            "source": "livekit"
+        }
+        
+        logger.info("🎤 REAL: Sending to displays: %s (%s): %.50s...", message_type, language, text)
+        # orjson returns UTF-8 bytes; the relay forwards this payload as-is
+        return orjson.dumps(message)
+
+    def _enqueue(self, payloads: list[bytes]):
+        """Queue payloads for the relay as a single entry (non-blocking)"""
+        # Nothing to deliver to (display server failed to start, or the job is shutting down)
+        if self._relay_task is None:
+            return
+        
+        # Drop the oldest pending entry when the relay falls behind so fresh captions still get through
+        if self._queue.full():
+            try:
+                self._queue.get_nowait()
+                logger.warning("Display broadcast queue full, dropped oldest message")
+            except asyncio.QueueEmpty:
+                pass
+        self._queue.put_nowait(payloads)
+
+    async def _relay(self):
+        """Drain queued display messages in batches and deliver them to the display clients"""
+        while True:
+            batch = list(await self._queue.get())
+            while len(batch) < _BROADCAST_BATCH_SIZE:
+                try:
+                    batch.extend(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            if self.mode == DISPLAY_MODE_IN_PROCESS:
+                await self._send_to_displays(batch)
+            else:
+                await self._post_to_display_server(batch)
 
-async def register_display(websocket):
-    """Register a new display client"""
-    global connected_displays
-    
-    connected_displays.add(websocket)
-    logger.info(f"Display client connected. Total displays: {len(connected_displays)}")
-    try:
-        await websocket.wait_closed()
-    finally:
-        connected_displays.discard(websocket)
-        logger.info(f"Display client disconnected. Total displays: {len(connected_displays)}")
-
-async def broadcast_to_displays(message_type: str, language: str, text: str):
-    """Send transcription/translation to external WebSocket server for display"""
-    message = {
-        "type": message_type,
-        "language": language,
-        "text": text,
-        "timestamp": time.time(),
-        "source": "livekit"
-    }
-    
-    message_json = json.dumps(message)
-    logger.info(f"🎤 REAL: Sending to display server: {message_type} ({language}): {text[:50]}...")
-    
-    # Send to external WebSocket server via HTTP POST
-    # (the external server will handle broadcasting to connected displays)
-    try:
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            async with session.post('http://localhost:8766/broadcast', 
-                                   json=message,
-                                   timeout=aiohttp.ClientTimeout(total=1)) as response:
+    async def _register_display(self, websocket):
+        """Register a new display client"""
+        self.connected_displays.add(websocket)
+        logger.info("Display client connected. Total displays: %d", len(self.connected_displays))
+        try:
+            await websocket.wait_closed()
+        finally:
+            self.connected_displays.discard(websocket)
+            logger.info("Display client disconnected. Total displays: %d", len(self.connected_displays))
+
+    async def _start_websocket_server(self):
+        """Start WebSocket server for display clients"""
+        logger.info("Starting WebSocket server for display clients on port 8765...")
+        server = await websockets.serve(self._register_display, "localhost", 8765)
+        logger.info("WebSocket server started on ws://localhost:8765")
+        return server
+
+    async def _safe_send(self, ws, payload: str):
+        """Send a payload to one display client, bounded by the send timeout"""
+        await asyncio.wait_for(ws.send(payload), timeout=_DISPLAY_SEND_TIMEOUT)
+
+    async def _broadcast_framed(self, payload: str):
+        """Send one payload to every connected display, yielding to the event loop between chunks of clients"""
+        # Chunking also caps concurrent socket writes at _DISPLAY_SEND_CHUNK (the relay is the only sender)
+        clients = list(self.connected_displays)
+        for i in range(0, len(clients), _DISPLAY_SEND_CHUNK):
+            chunk = clients[i:i + _DISPLAY_SEND_CHUNK]
+            results = await asyncio.gather(*[self._safe_send(ws, payload) for ws in chunk], return_exceptions=True)
+            
+            # Drop clients whose connection failed or timed out. Abort the socket so a stalled display
+            # sees the disconnect and reconnects, and _register_display's wait_closed() returns.
+            disconnected = [ws for ws, result in zip(chunk, results) if isinstance(result, Exception)]
+            for ws in disconnected:
+                self.connected_displays.discard(ws)
+                ws.transport.abort()
+            if disconnected:
+                logger.debug("Dropped %d display clients after failed or timed out sends", len(disconnected))
+            
+            # Let STT frame pushes and publishes run before the next chunk
+            if i + _DISPLAY_SEND_CHUNK < len(clients):
+                await asyncio.sleep(0)
+
+    async def _send_to_displays(self, payloads: list[bytes]):
+        """Send payloads directly to the display clients connected to this worker"""
+        for payload in payloads:
+            # Decode once per message so every client receives a text frame
+            await self._broadcast_framed(payload.decode("utf-8"))
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return this job's display-server HTTP session, creating it on first use"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+            )
+        return self._http_session
+
+    async def _post_to_display_server(self, payloads: list[bytes]):
+        """POST payloads to the external display server, which broadcasts them to its clients"""
+        try:
+            session = self._get_session()
+            async with session.post('http://localhost:8766/broadcast_batch', 
+                                   data=b"[" + b",".join(payloads) + b"]",
+                                   headers={"Content-Type": "application/json"},
+                                   timeout=_BROADCAST_TIMEOUT) as response:
                 if response.status == 200:
-                    logger.debug("Successfully sent to external display server")
+                    logger.debug("Successfully sent %d messages to external display server", len(payloads))
                 else:
-                    logger.warning(f"Display server responded with status {response.status}")
-    except Exception as e:
-        logger.debug(f"Could not send to display server (this is normal if no display server is running): {e}")
-
-async def start_websocket_server():
-    """Start WebSocket server for display clients"""
-    logger.info("Starting WebSocket server for display clients on port 8765...")
-    server = await websockets.serve(register_display, "localhost", 8765)
-    logger.info("WebSocket server started on ws://localhost:8765")
-    return server
+                    logger.warning("Display server responded with status %s", response.status)
+        except Exception as e:
+            logger.debug("Could not send to display server (this is normal if no display server is running): %s", e)
 
 
 @dataclass
@@ -98,55 +248,109 @@ languages = {
     "nl": Language(code="nl", name="Dutch", flag="🇳🇱"),  # Added Dutch
 }
 
+# Serialized once for the get/languages RPC - the language list never changes at runtime
+_LANGUAGES_JSON = orjson.dumps([asdict(lang) for lang in languages.values()]).decode("utf-8")
+
 LanguageCode = Enum(
     "LanguageCode",  # Name of the Enum
     {lang.name: code for code, lang in languages.items()},  # Enum entries: name -> code mapping
 )
 
+# Language name -> LanguageCode member, resolved once instead of per translator request
+_LANG_CODE_BY_NAME = {lang.name: LanguageCode[lang.name] for lang in languages.values()}
+
+# Runs of sentence terminators, including Arabic punctuation (Speechmatics STT doesn't add commas to Arabic)
+_TERMINATOR_RUN_RE = re.compile(r'[.!?؟،]+')
+
+
+def _scan_boundaries(text: str) -> list[int]:
+    """Return the end index of every run of sentence terminators in text"""
+    # finditer walks the string in C, so long accumulated buffers don't cost a bytecode step per character
+    return [m.end() for m in _TERMINATOR_RUN_RE.finditer(text)]
+
+
+_ID_POOL_SIZE = 256
+_ID_POOL_LOW_WATER = 64  # Refill once the pool drops below this
+
+
+class SegmentIdPool:
+    """Pre-generated transcription segment IDs for one job, refilled in the background.
+
+    next_id() wakes the refill task when the pool runs low, so nothing runs while the job is idle.
+    """
+
+    def __init__(self):
+        self._ids: deque = deque()
+        self._low = asyncio.Event()
+        self._refill_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Fill the pool and start the refill task"""
+        self._low.set()
+        self._refill_task = asyncio.create_task(self._refill())
+
+    async def aclose(self):
+        """Stop the refill task"""
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            try:
+                await self._refill_task
+            except asyncio.CancelledError:
+                pass
+            self._refill_task = None
+
+    def next_id(self) -> str:
+        """Return a transcription segment ID, from the pool when one is available"""
+        if len(self._ids) <= _ID_POOL_LOW_WATER:
+            self._low.set()
+        return self._ids.popleft() if self._ids else utils.misc.shortuuid("SG_")
+
+    async def _refill(self):
+        """Top the pool back up each time next_id() reports it running low"""
+        while True:
+            await self._low.wait()
+            self._low.clear()
+            self._ids.extend(utils.misc.shortuuid("SG_") for _ in range(_ID_POOL_SIZE - len(self._ids)))
+
 
 class Translator:
     # 🔧 TOGGLE: Set to False to disable rolling context (fresh context each translation)
     use_context = False  # Change to True to enable rolling 9-sentence context
     
-    def __init__(self, room: rtc.Room, lang: Enum):
+    def __init__(self, room: rtc.Room, lang: Enum, segment_ids: SegmentIdPool):
         self.room = room
         self.lang = lang
-        # Fixed: Use append_message instead of append
-        self.context = llm.ChatContext()
-        self.message_count = 0  # Track number of user messages
+        self.segment_ids = segment_ids
+        # Rolling window of the latest 9 user messages (oldest drops off automatically)
+        self._user_msgs: deque = deque(maxlen=9)
         self.system_prompt = (
             f"You are a simultaneous interpreter for a live islamic religious friday sermon. "
             f"Translate only the **most recent user sentence** into {lang.value}. The last 9 translated sentances are shown as context so you know how to translate the most recent one"
             f"Return **exactly that one sentence** in {lang.value}—no summaries, no commentary, be concise and to the point and use words that common in speech "
             f"no repetition of earlier lines. make sure to translate in {lang.value} only. "
         )
-        self.context.add_message(role="system", content=self.system_prompt)
+        # System-prompt-only context, copied for every translation
+        self._base_context = llm.ChatContext()
+        self._base_context.add_message(role="system", content=self.system_prompt)
         self.llm = openai.LLM()
         
         # Log the context mode being used
         context_mode = "ROLLING CONTEXT (9-message memory)" if self.use_context else "FRESH CONTEXT (no memory)"
-        logger.info(f"🧠 Translator initialized for {lang.value} with {context_mode} mode")
+        logger.info("🧠 Translator initialized for %s with %s mode", lang.value, context_mode)
 
-    async def translate(self, message: str, track: rtc.Track):
+    async def translate(self, message: str, track: rtc.Track) -> tuple[str, str]:
         if self.use_context:
-            # ROLLING CONTEXT MODE: Use accumulated context with 9-message limit
-            logger.debug(f"🔄 Using ROLLING CONTEXT mode (message #{self.message_count + 1})")
-            self.context.add_message(content=message, role="user")
-            self.message_count += 1
-            
-            # Keep only latest 9 user messages - recreate context when needed
-            if self.message_count > 9:
-                logger.info(f"🔄 Resetting context after 9 messages")
-                self.context = llm.ChatContext()
-                self.context.add_message(role="system", content=self.system_prompt)
-                self.message_count = 0
-                
-            stream = self.llm.chat(chat_ctx=self.context)
+            # ROLLING CONTEXT MODE: System prompt plus the latest 9 user messages
+            self._user_msgs.append(message)
+            logger.debug("🔄 Using ROLLING CONTEXT mode (%d messages in window)", len(self._user_msgs))
+            rolling_context = self._base_context.copy()
+            for user_msg in self._user_msgs:
+                rolling_context.add_message(content=user_msg, role="user")
+            stream = self.llm.chat(chat_ctx=rolling_context)
         else:
             # FRESH CONTEXT MODE: Create new context for each translation (no memory)
-            logger.debug(f"🆕 Using FRESH CONTEXT mode (no memory)")
-            fresh_context = llm.ChatContext()
-            fresh_context.add_message(role="system", content=self.system_prompt)
+            logger.debug("🆕 Using FRESH CONTEXT mode (no memory)")
+            fresh_context = self._base_context.copy()
             fresh_context.add_message(content=message, role="user")
             stream = self.llm.chat(chat_ctx=fresh_context)
         translated_message = ""
@@ -159,7 +363,7 @@ class Translator:
             translated_message += content
 
         segment = rtc.TranscriptionSegment(
-            id=utils.misc.shortuuid("SG_"),
+            id=self.segment_ids.next_id(),
             text=translated_message,
             start_time=0,
             end_time=0,
@@ -169,16 +373,17 @@ class Translator:
         transcription = rtc.Transcription(
             self.room.local_participant.identity, track.sid if track else "", [segment]
         )
-        await self.room.local_participant.publish_transcription(transcription)
-
-        # Also broadcast translation to WebSocket displays
-        asyncio.create_task(
-            broadcast_to_displays("translation", self.lang.value, translated_message)
-        )
+        try:
+            await self.room.local_participant.publish_transcription(transcription)
+        except Exception as e:
+            logger.error("❌ Failed to publish %s translation: %s", self.lang.value, e)
 
         print(
             f"message: {message}, translated to {self.lang.value}: {translated_message}"
         )
+        
+        # Display broadcast is batched across languages by the caller
+        return self.lang.value, translated_message
 
 
 def prewarm(proc: JobProcess):
@@ -206,14 +411,20 @@ async def entrypoint(job: JobContext):
     tasks = []
     translators = {}
     
+    # Pre-generate segment IDs in the background so publishes don't pay for them
+    segment_ids = SegmentIdPool()
+    segment_ids.start()
+    job.add_shutdown_callback(segment_ids.aclose)
+    
     # Create hardcoded Dutch translator (revert to working version)
-    dutch_enum = getattr(LanguageCode, 'Dutch')
-    translators["nl"] = Translator(job.room, dutch_enum)
+    dutch_enum = _LANG_CODE_BY_NAME['Dutch']
+    translators["nl"] = Translator(job.room, dutch_enum, segment_ids)
     
     # Sentence accumulation for proper sentence-by-sentence translation
-    accumulated_text = ""  # Accumulates text until we get a complete sentence
+    accum_chunks: list[str] = []  # Final transcripts accumulated until we get a complete sentence
     last_final_transcript = ""  # Keep track of the last final transcript to avoid duplicates
     translation_delay = 10.0  # Reduced to 2 seconds for faster incomplete sentence translation
+    interim_publish_interval = 0.05  # Publish interim transcripts at most once per 50ms
     pending_translation_task = None
     
     logger.info(f"🚀 Starting entrypoint for room: {job.room.name if job.room else 'unknown'}")
@@ -222,31 +433,27 @@ async def entrypoint(job: JobContext):
     logger.info(f"🗣️ STT configured for {languages[source_language].name} speech recognition using Speechmatics (source language: {source_language})")
     logger.info(f"🇸🇦 ARABIC is set as the default host/speaker language")
 
+    # Display broadcasts for this job; released (relay, server, HTTP session) when the job shuts down
+    displays = DisplayBroadcaster()
+    await displays.start()
+    job.add_shutdown_callback(displays.aclose)
+
     def _extract_complete_sentences(text: str):
         """Extract complete sentences from text and return them along with remaining incomplete text"""
         if not text.strip():
             return [], ""
         
-        # Use regex to find sentence endings - be more flexible with sentence detection
-        # Added Arabic punctuation marks (Speechmatics STT doesn't add commas to Arabic)
-        sentence_pattern = r'([.!?؟،]+)'
-        parts = re.split(sentence_pattern, text)
-        
+        # Each run of terminators closes the current sentence
         complete_sentences = []
-        remaining_text = ""
+        start = 0
+        for end in _scan_boundaries(text):
+            sentence = text[start:end].strip()
+            if sentence:
+                complete_sentences.append(sentence)
+            start = end
         
-        i = 0
-        while i < len(parts):
-            if i + 1 < len(parts) and re.match(r'[.!?؟،]+', parts[i+1]):
-                # This is a complete sentence
-                sentence = (parts[i] + parts[i+1]).strip()
-                if sentence and not sentence.isspace():
-                    complete_sentences.append(sentence)
-                i += 2
-            else:
-                # This might be incomplete text at the end
-                remaining_text = parts[i].strip()
-                break
+        # Whatever follows the last terminator is incomplete text
+        remaining_text = text[start:].strip()
         
         return complete_sentences, remaining_text
 
@@ -257,20 +464,31 @@ async def entrypoint(job: JobContext):
             
         for sentence in sentences:
             if sentence.strip():
-                logger.info(f"🎯 TRANSLATING COMPLETE ARABIC SENTENCE: '{sentence}'")
-                logger.info(f"📊 Processing sentence for {len(translators)} translators")
+                logger.info("🎯 TRANSLATING COMPLETE ARABIC SENTENCE: '%s'", sentence)
+                logger.info("📊 Processing sentence for %d translators", len(translators))
                 
                 # Send to all translators concurrently for better performance
                 translation_tasks = []
                 for lang, translator in translators.items():
-                    logger.info(f"📤 Sending complete Arabic sentence '{sentence}' to {lang} translator")
+                    logger.info("📤 Sending complete Arabic sentence '%s' to %s translator", sentence, lang)
                     translation_tasks.append(translator.translate(sentence, None))
                 
                 # Execute all translations concurrently
                 if translation_tasks:
-                    await asyncio.gather(*translation_tasks, return_exceptions=True)
+                    results = await asyncio.gather(*translation_tasks, return_exceptions=True)
+                    
+                    translations = []
+                    for result in results:
+                        if isinstance(result, Exception):
+                            logger.error("❌ Translation failed: %s", result)
+                        else:
+                            translations.append(result)
+                    
+                    # One display broadcast per sentence, covering every language
+                    if translations:
+                        displays.broadcast_translations(translations)
 
-    async def _delayed_translation(text: str, delay: float):
+    async def _delayed_translation(chunks: list[str], count: int, delay: float):
         """Wait for delay, then translate incomplete text if no new updates came in"""
         nonlocal pending_translation_task
         
@@ -278,8 +496,11 @@ async def entrypoint(job: JobContext):
             await asyncio.sleep(delay)
             # Check if this is still the latest translation task
             if pending_translation_task and not pending_translation_task.cancelled():
+                # chunks is only appended to after scheduling (or replaced), so its first `count`
+                # entries are still the text this task was scheduled for - join them only now
+                text = " ".join(chunks[:count])
                 if text.strip():
-                    logger.info(f"⏰ DELAYED TRANSLATION of incomplete Arabic text: '{text}'")
+                    logger.info("⏰ DELAYED TRANSLATION of incomplete Arabic text: '%s'", text)
                     await _translate_sentences([text])
                 pending_translation_task = None
         except asyncio.CancelledError:
@@ -290,7 +511,52 @@ async def entrypoint(job: JobContext):
         track: rtc.Track,
     ):
         """Forward the transcription and log the transcript in the console"""
-        nonlocal accumulated_text, last_final_transcript, pending_translation_task
+        nonlocal accum_chunks, last_final_transcript, pending_translation_task
+        
+        # Interim debouncing: publish at most once per interim_publish_interval, trailing flush for the latest text
+        latest_interim_text = ""
+        last_published_interim_text = ""
+        last_interim_publish = 0.0
+        interim_flush_task = None
+        
+        # One segment/transcription pair reused for every source-language publish. Safe because
+        # publish_transcription copies the segment into its request before its first await.
+        source_segment = rtc.TranscriptionSegment(
+            id="",
+            text="",
+            start_time=0,
+            end_time=0,
+            language=source_language,  # Arabic
+            final=False,
+        )
+        source_transcription = rtc.Transcription(
+            job.room.local_participant.identity, "", [source_segment]
+        )
+        
+        async def _publish_interim(text: str):
+            """Publish an interim transcription for real-time word-by-word display"""
+            nonlocal last_interim_publish, last_published_interim_text
+            
+            # STT sometimes re-emits the same interim - nothing new to show
+            if text == last_published_interim_text:
+                return
+            last_published_interim_text = text
+            last_interim_publish = time.monotonic()
+            try:
+                source_segment.id = segment_ids.next_id()
+                source_segment.text = text
+                source_segment.final = False  # This is interim, not final
+                await job.room.local_participant.publish_transcription(source_transcription)
+            except Exception as e:
+                logger.debug("Failed to publish interim transcription: %s", e)
+        
+        async def _flush_interim(delay: float):
+            """Publish the latest interim text once the debounce window closes"""
+            nonlocal interim_flush_task
+            
+            await asyncio.sleep(delay)
+            interim_flush_task = None
+            await _publish_interim(latest_interim_text)
         
         try:
             async for ev in stt_stream:
@@ -298,74 +564,64 @@ async def entrypoint(job: JobContext):
                 if ev.type == stt.SpeechEventType.INTERIM_TRANSCRIPT:
                     print(ev.alternatives[0].text, end="", flush=True)
                     
-                    # Publish interim transcription for real-time word-by-word display
                     interim_text = ev.alternatives[0].text.strip()
                     if interim_text:
-                        try:
-                            interim_segment = rtc.TranscriptionSegment(
-                                id=utils.misc.shortuuid("SG_"),
-                                text=interim_text,
-                                start_time=0,
-                                end_time=0,
-                                language=source_language,  # Arabic
-                                final=False,  # This is interim, not final
-                            )
-                            interim_transcription = rtc.Transcription(
-                                job.room.local_participant.identity, "", [interim_segment]
+                        latest_interim_text = interim_text
+                        elapsed = time.monotonic() - last_interim_publish
+                        if elapsed >= interim_publish_interval:
+                            if interim_flush_task:
+                                interim_flush_task.cancel()
+                                interim_flush_task = None
+                            await _publish_interim(interim_text)
+                        elif interim_flush_task is None:
+                            # Too soon - make sure the newest interim still lands when the window closes
+                            interim_flush_task = asyncio.create_task(
+                                _flush_interim(interim_publish_interval - elapsed)
                             )
-                            await job.room.local_participant.publish_transcription(interim_transcription)
-                        except Exception as e:
-                            logger.debug(f"Failed to publish interim transcription: {str(e)}")
                     
                 elif ev.type == stt.SpeechEventType.FINAL_TRANSCRIPT:
+                    # The final transcript supersedes any interim still waiting to be flushed
+                    if interim_flush_task:
+                        interim_flush_task.cancel()
+                        interim_flush_task = None
+                    last_published_interim_text = ""
+                    
                     print("\n")
                     final_text = ev.alternatives[0].text.strip()
                     print(" -> ", final_text)
-                    logger.info(f"Final Arabic transcript: {final_text}")
+                    logger.info("Final Arabic transcript: %s", final_text)
 
                     if final_text and final_text != last_final_transcript:
                         last_final_transcript = final_text
                         
                         # Publish final transcription for the original language (Arabic)
                         try:
-                            final_segment = rtc.TranscriptionSegment(
-                                id=utils.misc.shortuuid("SG_"),
-                                text=final_text,
-                                start_time=0,
-                                end_time=0,
-                                language=source_language,  # Arabic
-                                final=True,
-                            )
-                            final_transcription = rtc.Transcription(
-                                job.room.local_participant.identity, "", [final_segment]
-                            )
-                            await job.room.local_participant.publish_transcription(final_transcription)
+                            source_segment.id = segment_ids.next_id()
+                            source_segment.text = final_text
+                            source_segment.final = True
+                            await job.room.local_participant.publish_transcription(source_transcription)
                             
                             # Also broadcast Arabic transcription to WebSocket display clients
-                            asyncio.create_task(broadcast_to_displays("transcription", source_language, final_text))
+                            displays.broadcast("transcription", source_language, final_text)
                             
-                            logger.info(f"✅ Published final {languages[source_language].name} transcription: '{final_text}'")
+                            logger.info("✅ Published final %s transcription: '%s'", languages[source_language].name, final_text)
                         except Exception as e:
-                            logger.error(f"❌ Failed to publish final transcription: {str(e)}")
+                            logger.error("❌ Failed to publish final transcription: %s", e)
                         
                         # Handle translation logic
                         if translators:
                             # SIMPLE ACCUMULATION LOGIC - ONLY APPEND, NEVER REPLACE
-                            if accumulated_text:
-                                # ALWAYS append new final transcript to existing accumulated text
-                                accumulated_text = accumulated_text.strip() + " " + final_text
-                            else:
-                                # First transcript - start accumulation
-                                accumulated_text = final_text
-                            
-                            logger.info(f"📝 Updated accumulated Arabic text: '{accumulated_text}'")
+                            accum_chunks.append(final_text)
+                            logger.info("📝 Accumulated Arabic transcript chunk #%d: '%s'", len(accum_chunks), final_text)
                             
-                            # Extract complete sentences from accumulated text
-                            complete_sentences, remaining_text = _extract_complete_sentences(accumulated_text)
-                            
-                            if complete_sentences:
+                            # Earlier chunks never contain a terminator (the buffer is cut at the last one),
+                            # so only the new transcript needs scanning. The buffer is joined only once a
+                            # sentence completes, and is reset right after, keeping accumulation O(N) overall.
+                            if _TERMINATOR_RUN_RE.search(final_text):
+                                complete_sentences, remaining_text = _extract_complete_sentences(" ".join(accum_chunks))
+                                
                                 # We have complete sentences - translate them immediately
-                                logger.info(f"🎯 Found {len(complete_sentences)} complete Arabic sentences: {complete_sentences}")
+                                logger.info("🎯 Found %d complete Arabic sentences: %s", len(complete_sentences), complete_sentences)
                                 
                                 # Cancel any pending translation
                                 if pending_translation_task:
@@ -375,13 +631,13 @@ async def entrypoint(job: JobContext):
                                 # Translate complete sentences
                                 await _translate_sentences(complete_sentences)
                                 
-                                # Update accumulated text to only remaining incomplete text
-                                accumulated_text = remaining_text
-                                logger.info(f"📝 Updated accumulated Arabic text after sentence extraction: '{accumulated_text}'")
+                                # Keep only the remaining incomplete text (a new list, see _delayed_translation)
+                                accum_chunks = [remaining_text] if remaining_text else []
+                                logger.info("📝 Remaining incomplete Arabic text after sentence extraction: '%s'", remaining_text)
                             
                             # Handle remaining incomplete text with shorter delay
-                            if accumulated_text.strip():
-                                logger.info(f"📝 Incomplete Arabic text remaining, setting up delayed translation: '{accumulated_text}'")
+                            if accum_chunks:
+                                logger.info("📝 Incomplete Arabic text remaining (%d chunks), setting up delayed translation", len(accum_chunks))
                                 
                                 # Cancel any previous pending translation
                                 if pending_translation_task:
@@ -389,7 +645,7 @@ async def entrypoint(job: JobContext):
                                 
                                 # Set up new delayed translation for incomplete text
                                 pending_translation_task = asyncio.create_task(
-                                    _delayed_translation(accumulated_text, translation_delay)
+                                    _delayed_translation(accum_chunks, len(accum_chunks), translation_delay)
                                 )
                             else:
                                 # No remaining text - cancel any pending translation
@@ -397,12 +653,15 @@ async def entrypoint(job: JobContext):
                                     pending_translation_task.cancel()
                                     pending_translation_task = None
                         else:
-                            logger.warning(f"⚠️ No translators available in room {job.room.name}, only {languages[source_language].name} transcription published")
+                            logger.warning("⚠️ No translators available in room %s, only %s transcription published", job.room.name, languages[source_language].name)
                     else:
                         logger.debug("Empty or duplicate transcription, skipping")
         except Exception as e:
-            logger.error(f"STT transcription error: {str(e)}")
+            logger.error("STT transcription error: %s", e)
             raise
+        finally:
+            if interim_flush_task:
+                interim_flush_task.cancel()
 
     async def transcribe_track(participant: rtc.RemoteParticipant, track: rtc.Track):
         try:
@@ -464,44 +723,44 @@ async def entrypoint(job: JobContext):
         """
         When participant attributes change, handle new translation requests.
         """
-        logger.info(f"🌍 Participant {participant.identity} attributes changed: {changed_attributes}")
+        logger.info("🌍 Participant %s attributes changed: %s", participant.identity, changed_attributes)
         lang = changed_attributes.get("captions_language", None)
         if lang:
             if lang == source_language:
-                logger.info(f"✅ Participant {participant.identity} requested {languages[source_language].name} (source language - Arabic)")
+                logger.info("✅ Participant %s requested %s (source language - Arabic)", participant.identity, languages[source_language].name)
             elif lang in translators:
-                logger.info(f"✅ Participant {participant.identity} requested existing language: {lang}")
-                logger.info(f"📊 Current translators for this room: {list(translators.keys())}")
+                logger.info("✅ Participant %s requested existing language: %s", participant.identity, lang)
+                logger.info("📊 Current translators for this room: %s", list(translators))
             else:
                 # Check if the language is supported and different from source language
                 if lang in languages:
                     try:
                         # Create a translator for the requested language using the language enum
                         language_obj = languages[lang]
-                        language_enum = getattr(LanguageCode, language_obj.name)
-                        translators[lang] = Translator(job.room, language_enum)
-                        logger.info(f"🆕 Added translator for ROOM {job.room.name} (requested by {participant.identity}), language: {language_obj.name}")
-                        logger.info(f"📊 Total translators for room {job.room.name}: {len(translators)} -> {list(translators.keys())}")
-                        logger.info(f"🔍 Translators dict ID: {id(translators)}")
+                        language_enum = _LANG_CODE_BY_NAME[language_obj.name]
+                        translators[lang] = Translator(job.room, language_enum, segment_ids)
+                        logger.info("🆕 Added translator for ROOM %s (requested by %s), language: %s", job.room.name, participant.identity, language_obj.name)
+                        logger.info("📊 Total translators for room %s: %d -> %s", job.room.name, len(translators), list(translators))
+                        logger.info("🔍 Translators dict ID: %s", id(translators))
                         
                         # Debug: Verify the translator was actually added
                         if lang in translators:
-                            logger.info(f"✅ Translator verification: {lang} successfully added to room translators")
+                            logger.info("✅ Translator verification: %s successfully added to room translators", lang)
                         else:
-                            logger.error(f"❌ Translator verification FAILED: {lang} not found in translators dict")
+                            logger.error("❌ Translator verification FAILED: %s not found in translators dict", lang)
                             
                     except Exception as e:
-                        logger.error(f"❌ Error creating translator for {lang}: {str(e)}")
+                        logger.error("❌ Error creating translator for %s: %s", lang, e)
                 else:
-                    logger.warning(f"❌ Unsupported language requested by {participant.identity}: {lang}")
-                    logger.info(f"💡 Supported languages: {list(languages.keys())}")
+                    logger.warning("❌ Unsupported language requested by %s: %s", participant.identity, lang)
+                    logger.info("💡 Supported languages: %s", list(languages))
         else:
-            logger.debug(f"No caption language change for participant {participant.identity}")
+            logger.debug("No caption language change for participant %s", participant.identity)
 
     logger.info("Connecting to room...")
     await job.connect(auto_subscribe=AutoSubscribe.AUDIO_ONLY)
     logger.info(f"Successfully connected to room: {job.room.name}")
-    logger.info(f"📡 Real transcription data will be sent to external WebSocket server on ws://localhost:8765")
+    logger.info("📡 Real transcription data will be sent to display clients on ws://localhost:8765")
     
     # Debug room state after connection
     logger.info(f"Room participants: {len(job.room.remote_participants)}")
@@ -517,8 +776,7 @@ async def entrypoint(job: JobContext):
 
     @job.room.local_participant.register_rpc_method("get/languages")
     async def get_languages(data: rtc.RpcInvocationData):
-        languages_list = [asdict(lang) for lang in languages.values()]
-        return json.dumps(languages_list)
+        return _LANGUAGES_JSON
 
 
 async def request_fnc(req: JobRequest):
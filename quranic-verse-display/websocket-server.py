@@ -78,16 +78,27 @@ async def broadcast_to_displays(message_type: str, language: str, text: str):
     # Remove disconnected clients
     connected_displays -= disconnected
 
+def parse_broadcast_message(data):
+    """Return (type, language, text) for a valid broadcast message, or None if it is malformed"""
+    if not isinstance(data, dict):
+        return None
+    
+    message_type = data.get("type")
+    language = data.get("language")
+    text = data.get("text")
+    
+    if message_type and language and text:
+        return message_type, language, text
+    return None
+
 async def handle_broadcast_request(request):
     """HTTP endpoint to receive real transcription data from LiveKit backend"""
     try:
         data = await request.json()
-        message_type = data.get("type")
-        language = data.get("language")
-        text = data.get("text")
+        fields = parse_broadcast_message(data)
         
-        if message_type and language and text:
-            await broadcast_to_displays(message_type, language, text)
+        if fields:
+            await broadcast_to_displays(*fields)
             return web.json_response({"status": "success"})
         else:
             return web.json_response({"status": "error", "message": "Missing required fields"}, status=400)
@@ -98,6 +109,32 @@ async def handle_broadcast_request(request):
         logger.error(f"Error processing broadcast request: {e}")
         return web.json_response({"status": "error", "message": str(e)}, status=500)
 
+async def handle_broadcast_batch_request(request):
+    """HTTP endpoint to receive a batch of real transcription data from LiveKit backend"""
+    try:
+        data = await request.json()
+        
+        if not isinstance(data, list):
+            return web.json_response({"status": "error", "message": "Expected a list of messages"}, status=400)
+        
+        broadcast_count = 0
+        for item in data:
+            fields = parse_broadcast_message(item)
+            
+            if fields:
+                await broadcast_to_displays(*fields)
+                broadcast_count += 1
+            else:
+                logger.warning(f"Skipping malformed batch item: {item!r}")
+        
+        return web.json_response({"status": "success", "count": broadcast_count})
+            
+    except json.JSONDecodeError:
+        return web.json_response({"status": "error", "message": "Invalid JSON"}, status=400)
+    except Exception as e:
+        logger.error(f"Error processing broadcast batch request: {e}")
+        return web.json_response({"status": "error", "message": str(e)}, status=500)
+
 async def start_servers():
     """Start both WebSocket and HTTP servers"""
     logger.info("🚀 Starting WebSocket server for display clients on port 8765...")
@@ -106,6 +143,7 @@ async def start_servers():
     # Create HTTP app
     app = web.Application()
     app.router.add_post('/broadcast', handle_broadcast_request)
+    app.router.add_post('/broadcast_batch', handle_broadcast_batch_request)
     
     # Start HTTP server
     runner = web.AppRunner(app)
@@ -119,6 +157,7 @@ async def start_servers():
         logger.info("✅ HTTP server started on http://localhost:8766")
         logger.info("📱 Display clients can connect to ws://localhost:8765")
         logger.info("🎤 LiveKit backend can send real data to http://localhost:8766/broadcast")
+        logger.info("🎤 Batched data is accepted on http://localhost:8766/broadcast_batch")
         logger.info("🎯 Ready to receive real Arabic transcriptions and translations!")
         
         try: